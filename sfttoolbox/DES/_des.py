@@ -28,12 +28,15 @@ This module is designed to be flexible and extensible, allowing users to customi
 attributes, and generation logic according to their specific needs.
 """
 
-__all__ = ["Simulation", "distribution_wrapper"]
+__all__ = ["BufferedUniform", "Simulation", "distribution_wrapper"]
 
 import functools
 import logging
-from itertools import cycle
-from typing import Any, Dict, List, Optional, Protocol
+import math
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import accumulate, cycle
+from typing import Any, Dict, List, NamedTuple, Optional, Protocol, Tuple
 
 import networkx as nx
 import numpy as np
@@ -98,6 +101,35 @@ class CapacityInterface(Protocol):
         """
 
 
+class _RoutingEntry(NamedTuple):
+    """
+    Routing information for a single node, compiled once from the graph so traversal doesn't walk NetworkX per hop.
+
+    Attributes:
+        next_nodes (tuple): The successors of the node, in edge insertion order.
+        cum_probs (List[float]): Cumulative edge probabilities, aligned with `next_nodes`.
+        sums_to_one (bool): Whether the edge probabilities add up to 1.
+        bernoulli (tuple): The "bernoulli" attribute of each outgoing edge, aligned with `next_nodes`.
+        capacity_edge_index (Optional[int]): Index of the edge to follow when the node's capacity refuses a patient.
+        distribution (Optional[callable]): The node's distribution function.
+        capacity (Optional[CapacityInterface]): The node's capacity object.
+        resource (Any): The node's resource.
+        chain (tuple): The run of single-successor nodes without capacity starting at this node, empty otherwise.
+        chain_end (Any): The node reached at the end of `chain`.
+    """
+
+    next_nodes: tuple
+    cum_probs: List[float]
+    sums_to_one: bool
+    bernoulli: tuple
+    capacity_edge_index: Optional[int]
+    distribution: Optional[callable]
+    capacity: Optional[CapacityInterface]
+    resource: Any
+    chain: tuple
+    chain_end: Any
+
+
 def distribution_wrapper(func: callable) -> callable:
     """
     A decorator that wraps a distribution function to allow it fit the interface in Simulation.
@@ -116,6 +148,44 @@ def distribution_wrapper(func: callable) -> callable:
     return wrapper
 
 
+class BufferedUniform:
+    def __init__(self, buffer_size: int = 4096, seed: Optional[int] = None) -> None:
+        """
+        A uniform distribution on [0, 1) that fits the interface in Simulation, drawing its values in batches.
+
+        Drawing a single value from NumPy is dominated by the call overhead, so values are drawn `buffer_size` at a
+        time and served from the buffer until it runs out. This is much faster than calling `np.random.uniform()` for
+        every patient. Other distributions can be used by wrapping them with `distribution_wrapper` instead.
+
+        Args:
+            buffer_size (int, optional): The number of values to draw at a time. Defaults to 4096.
+            seed (Optional[int], optional): Seed for the random number generator. Defaults to None.
+        """
+        # Giving it a name makes the graph look nicer!
+        self.__name__ = self.__class__.__name__
+
+        self.buffer_size = buffer_size
+        self.rng = np.random.default_rng(seed)
+
+        self._buffer = []
+        self._index = 0
+
+    def __call__(self, *args, **kwargs) -> float:
+        """
+        Serve the next value from the buffer, refilling it if empty.
+
+        Returns:
+            float: A value drawn uniformly from [0, 1).
+        """
+        if self._index >= len(self._buffer):
+            self._buffer = self.rng.random(self.buffer_size).tolist()
+            self._index = 0
+
+        value = self._buffer[self._index]
+        self._index += 1
+        return value
+
+
 class Simulation:
     def __init__(
         self,
@@ -135,11 +205,9 @@ class Simulation:
         self.final_day_num = number_of_days
         self.graph = graph
         self.graph_checked = self.check_graph()
-        self.start_node = self.identify_start_node()
+        self.refresh_routing()
         self.patient_generator = patient_generator
 
-        self.capacities = self.collect_capacities()
-
         self.discharged_patients = []
 
         days_of_the_week = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
@@ -173,7 +241,7 @@ class Simulation:
         Raises:
             AttributeError: If no starting node is found.
         """
-        for node, degree in self.graph.in_degree:
+        for node, degree in self._in_degree.items():
             if degree == 0:
                 starting_node = node
                 break
@@ -190,7 +258,114 @@ class Simulation:
         Returns:
             Dict[Any, Any]: A dictionary of capacities for each node.
         """
-        return nx.get_node_attributes(self.graph, "capacity")
+        return {
+            node: node_attrs["capacity"]
+            for node, node_attrs in self._node_attrs.items()
+            if "capacity" in node_attrs
+        }
+
+    def refresh_routing(self) -> None:
+        """
+        Compile the routing tables used by `traverse_graph` from the graph, and collect its start node and capacities.
+
+        This is called on initialisation, call it again if the graph is modified afterwards.
+        """
+        self._snapshot_graph()
+
+        self.start_node = self.identify_start_node()
+        self.capacities = self.collect_capacities()
+        self._capacity_items = tuple(self.capacities.items())
+
+        self._routing = {node: self._compile_node(node) for node in self._node_attrs}
+        self._is_terminal = {
+            node: self._out_degree[node] == 0 and "capacity" not in node_attrs
+            for node, node_attrs in self._node_attrs.items()
+        }
+
+    def _snapshot_graph(self) -> None:
+        """
+        Take a snapshot of the degrees, attributes and successors of every node so they are plain dictionary lookups.
+        """
+        self._in_degree = dict(self.graph.in_degree())
+        self._out_degree = dict(self.graph.out_degree())
+        self._node_attrs = {node: self.graph.nodes[node] for node in self.graph}
+        self._succ = {node: list(self.graph.successors(node)) for node in self.graph}
+        self._edge_attrs = {
+            node: [self.graph[node][next_node] for next_node in next_nodes]
+            for node, next_nodes in self._succ.items()
+        }
+
+    def _compile_node(self, node: Any) -> _RoutingEntry:
+        """
+        Compile the routing information for a single node.
+
+        Args:
+            node (Any): The node in the graph.
+
+        Returns:
+            _RoutingEntry: The routing information for the node.
+        """
+        node_attrs = self._node_attrs[node]
+        next_nodes = tuple(self._succ[node])
+        edge_attrs = self._edge_attrs[node]
+
+        cum_probs = [
+            float(cum_prob)
+            for cum_prob in accumulate(
+                edge_attr.get("probability", 0) for edge_attr in edge_attrs
+            )
+        ]
+
+        sums_to_one = bool(next_nodes) and math.isclose(cum_probs[-1], 1)
+        if sums_to_one:
+            # So a draw above a total just short of 1 still selects the last edge
+            cum_probs[-1] = 1.0
+
+        # Patients refused by a capacity follow the edge marked "capacity", falling back to the last edge
+        capacity_edge_index = len(next_nodes) - 1 if next_nodes else None
+        for edge_index, edge_attr in enumerate(edge_attrs):
+            if "capacity" in edge_attr:
+                capacity_edge_index = edge_index
+                break
+
+        chain, chain_end = self._compile_chain(node)
+
+        return _RoutingEntry(
+            next_nodes=next_nodes,
+            cum_probs=cum_probs,
+            sums_to_one=sums_to_one,
+            bernoulli=tuple(edge_attr.get("bernoulli") for edge_attr in edge_attrs),
+            capacity_edge_index=capacity_edge_index,
+            distribution=node_attrs.get("distribution"),
+            capacity=node_attrs.get("capacity"),
+            resource=node_attrs.get("resource"),
+            chain=chain,
+            chain_end=chain_end,
+        )
+
+    def _compile_chain(self, node: Any) -> Tuple[tuple, Any]:
+        """
+        Collect the run of nodes starting at `node` that a patient passes straight through.
+
+        A node is passed straight through when it has a single successor and no capacity, so there is no decision to
+        make there. Traversal appends the whole run to the pathway at once rather than hopping node by node.
+
+        Args:
+            node (Any): The node in the graph.
+
+        Returns:
+            Tuple[tuple, Any]: The nodes in the run and the node reached at the end of it.
+        """
+        chain = []
+        while (
+            self._out_degree[node] == 1
+            and not self._node_attrs[node].get("capacity")
+            and node not in chain
+        ):
+            chain.append(node)
+            node = self._succ[node][0]
+
+        return tuple(chain), node
 
     def run_simulation(self) -> None:
         """
@@ -203,34 +378,39 @@ class Simulation:
         for day_num, day in zip(range(0, self.final_day_num, 1), self.days_of_week):
             self.day_num = day_num
             self.day = day
-            logger.info(f"day number: {day_num}, day: {day}")
-
-            patients_to_move = {
-                node: capacity.update_day(day_num, day)
-                for node, capacity in self.capacities.items()
-            }
-            if any(patients_to_move.values()):
-                # TODO: use itertools here
-                for node, patients in patients_to_move.items():
+            logger.info("day number: %s, day: %s", day_num, day)
+            # Checked once a day so per-patient messages cost nothing when debug logging is off
+            log_patients = logger.isEnabledFor(logging.DEBUG)
+
+            # Every capacity is updated before any patient moves on
+            patients_to_move = [
+                (node, capacity.update_day(day_num, day))
+                for node, capacity in self._capacity_items
+            ]
+            for node, patients in patients_to_move:
+                if log_patients:
                     for patient in patients:
-                        logger.info(f"Moving previous patient: patient {patient.id}")
-
-                        discharged_patient = self.traverse_graph(
-                            node, patient, check_capacity=False
-                        )
-                        # TODO: abstract this out
-                        if discharged_patient is not None:
-                            self.discharged_patients.append(discharged_patient)
+                        logger.debug("Moving previous patient: patient %s", patient.id)
+
+                self.discharged_patients.extend(
+                    filter(
+                        None,
+                        (
+                            self.traverse_graph(node, patient, check_capacity=False)
+                            for patient in patients
+                        ),
+                    )
+                )
 
             new_patients = self.patient_generator.generate_patients(day_num, day)
 
-            node = self.start_node
-            for patient in new_patients:
-                logger.info(f"New patient generated: patient {patient.id}")
+            if log_patients:
+                for patient in new_patients:
+                    logger.debug("New patient generated: patient %s", patient.id)
 
-                discharged_patient = self.traverse_graph(node, patient)
-                if discharged_patient:
-                    self.discharged_patients.append(discharged_patient)
+            self.discharged_patients.extend(
+                filter(None, self._traverse_graph_batch(self.start_node, new_patients))
+            )
 
     def traverse_graph(
         self, node: Any, patient: PatientInterface, check_capacity: bool = True
@@ -246,71 +426,172 @@ class Simulation:
         Returns:
             Optional[Patient]: The patient if they are discharged, otherwise None.
         """
-        node_attrs = self.graph.nodes[node]
-        next_nodes_and_edge_attrs = [*zip(*self.graph[node].items())]
+        routing = self._routing
+        is_terminal = self._is_terminal
+        log_hops = logger.isEnabledFor(logging.DEBUG)
+
+        while True:
+            entry = routing[node]
+
+            if entry.chain:
+                patient.pathway.extend(entry.chain)
+                next_node = entry.chain_end
+
+            elif check_capacity and entry.capacity:
+                if entry.capacity.get(
+                    resource=entry.resource,
+                    patient=patient,
+                    day_num=self.day_num,
+                    day=self.day,
+                ):
+                    return
+                next_node = entry.next_nodes[entry.capacity_edge_index]
 
-        # Pathway required for terminal capacity node
-        if next_nodes_and_edge_attrs:
-            next_nodes, edge_attrs = next_nodes_and_edge_attrs
-        else:
-            next_nodes, edge_attrs = [], dict()
-
-        capacity = node_attrs.get("capacity")
-        if check_capacity and capacity:
-            resource = node_attrs["resource"]
-
-            if not capacity.get(
-                resource=resource, patient=patient, day_num=self.day_num, day=self.day
-            ):
-                for edge_index, edge_attr in enumerate(edge_attrs):
-                    if "capacity" in edge_attr:
-                        break
-                next_node = next_nodes[edge_index]
             else:
-                return
+                patient.pathway.append(node)
+                next_nodes = entry.next_nodes
+
+                if len(next_nodes) == 1:
+                    next_node = next_nodes[0]
+                elif len(next_nodes) == 0:
+                    # Final node reached - pathway for terminal nodes with capacity
+                    return patient
+                else:
+                    next_node = self._select_next_node(
+                        node, entry, entry.distribution(patient)
+                    )
 
-        else:
-            patient.pathway.append(node)
+            if log_hops:
+                logger.debug("Moving to next node: %s", next_node)
 
-            if len(next_nodes) == 1:
-                next_node = next_nodes[0]
-            elif len(next_nodes) == 0:
-                # Final node reached - pathway for terminal nodes with capacity
+            if is_terminal[next_node]:
+                # Final node reached
+                patient.pathway.append(next_node)
                 return patient
-            else:
-                prob = node_attrs.get("distribution")(patient)
 
-                traverse_probs = np.cumsum(
-                    [edge_attr.get("probability", 0) for edge_attr in edge_attrs]
-                )
+            node = next_node
+            check_capacity = True
 
-                if traverse_probs[-1] != 1:
-                    bernoulli = [edge_attr.get("bernoulli") for edge_attr in edge_attrs]
+    def _traverse_graph_batch(
+        self, node: Any, patients: List[PatientInterface]
+    ) -> List[Optional[PatientInterface]]:
+        """
+        Traverse the graph for a batch of patients starting from the same node.
 
-                    if any(bernoulli):
-                        assert (
-                            len(bernoulli) == 2
-                        ), f"When using Bernoulli, there should only be 2 options, check node {node}"
-                        next_node = (
-                            next_nodes[0] if bernoulli[0] == prob else next_nodes[1]
-                        )
+        Patients sitting at the same node are advanced together, drawing the next edge for the whole group in one
+        NumPy call. Once a patient reaches a node with a capacity they continue individually with `traverse_graph`,
+        in the order they were given, so capacities see patients in the same order as traversing them one at a time.
 
-                    else:
-                        raise ValueError(
-                            f"Probabilities of pathway must add up to 1 or contain a Bernoulli trial, check node {node}"
-                        )
+        Args:
+            node (Any): The node the patients start from.
+            patients (List[PatientInterface]): The patients being processed.
 
+        Returns:
+            List[Optional[PatientInterface]]: For each patient, the patient if they are discharged, otherwise None.
+        """
+        routing = self._routing
+        is_terminal = self._is_terminal
+        log_hops = logger.isEnabledFor(logging.DEBUG)
+
+        results = [None] * len(patients)
+        capacity_nodes = {}
+        waiting = {node: list(range(len(patients)))} if patients else {}
+
+        while waiting:
+            node, indices = waiting.popitem()
+            entry = routing[node]
+
+            if entry.capacity:
+                for index in indices:
+                    capacity_nodes[index] = node
+                continue
+
+            if entry.chain:
+                for index in indices:
+                    patients[index].pathway.extend(entry.chain)
+                next_groups = [(entry.chain_end, indices)]
+
+            else:
+                for index in indices:
+                    patients[index].pathway.append(node)
+                next_nodes = entry.next_nodes
+
+                if len(next_nodes) == 1:
+                    next_groups = [(next_nodes[0], indices)]
+                elif len(next_nodes) == 0:
+                    # Final node reached
+                    for index in indices:
+                        results[index] = patients[index]
+                    continue
                 else:
-                    next_node = next_nodes[np.searchsorted(traverse_probs, prob)]
+                    probs = [entry.distribution(patients[index]) for index in indices]
 
-        logger.info(f"Moving to next node: {next_node}")
+                    if entry.sums_to_one:
+                        chosen = [
+                            next_nodes[edge_index]
+                            for edge_index in np.searchsorted(entry.cum_probs, probs)
+                        ]
+                    else:
+                        chosen = [
+                            self._select_next_node(node, entry, prob) for prob in probs
+                        ]
+
+                    groups = defaultdict(list)
+                    for index, next_node in zip(indices, chosen):
+                        groups[next_node].append(index)
+                    next_groups = groups.items()
+
+            for next_node, next_indices in next_groups:
+                if log_hops:
+                    logger.debug(
+                        "Moving %s patients to next node: %s",
+                        len(next_indices),
+                        next_node,
+                    )
+
+                if is_terminal[next_node]:
+                    # Final node reached
+                    for index in next_indices:
+                        patients[index].pathway.append(next_node)
+                        results[index] = patients[index]
+                else:
+                    waiting.setdefault(next_node, []).extend(next_indices)
 
-        if self.graph.out_degree[next_node] > 0 or next_node in self.capacities:
-            return self.traverse_graph(next_node, patient)
-        else:
-            # Final node reached
-            patient.pathway.append(next_node)
-            return patient
+        for index, patient in enumerate(patients):
+            if index in capacity_nodes:
+                results[index] = self.traverse_graph(capacity_nodes[index], patient)
+
+        return results
+
+    @staticmethod
+    def _select_next_node(node: Any, entry: _RoutingEntry, prob: Any) -> Any:
+        """
+        Select the next node from a node with multiple outgoing edges.
+
+        Args:
+            node (Any): The current node in the graph.
+            entry (_RoutingEntry): The routing information for the current node.
+            prob (Any): The value drawn from the node's distribution.
+
+        Returns:
+            Any: The next node.
+
+        Raises:
+            ValueError: If the probabilities don't add up to 1 and no Bernoulli trial is defined.
+        """
+        if entry.sums_to_one:
+            return entry.next_nodes[bisect_left(entry.cum_probs, prob)]
+
+        bernoulli = entry.bernoulli
+        if any(bernoulli):
+            assert (
+                len(bernoulli) == 2
+            ), f"When using Bernoulli, there should only be 2 options, check node {node}"
+            return entry.next_nodes[0] if bernoulli[0] == prob else entry.next_nodes[1]
+
+        raise ValueError(
+            f"Probabilities of pathway must add up to 1 or contain a Bernoulli trial, check node {node}"
+        )
 
     def plot_graph(self, filename: str) -> None:
         """
@@ -319,11 +600,17 @@ class Simulation:
         Args:
             filename (str): The name of the file where the graph visualization will be saved.
         """
-        node_numbers = {v: k for k, v in dict(enumerate(self.graph.nodes)).items()}
+        # Each node is formatted once, rather than once per edge it's an endpoint of
+        formatted_nodes = {
+            node: f"{node_number}[{self.__format_node(node, node_attrs)}]"
+            for node_number, (node, node_attrs) in enumerate(
+                self.graph.nodes(data=True)
+            )
+        }
 
         graph_string = "\n".join(
             [
-                self.__format_edge(edge, node_numbers)
+                self.__format_edge(edge, formatted_nodes)
                 for edge in self.graph.edges(data=True)
             ]
         )
@@ -371,13 +658,13 @@ class Simulation:
         atts = "\n".join(atts)
         return f"{node_name}\n{atts}"
 
-    def __format_edge(self, edge: Any, node_numbers: Dict[Any, int]) -> str:
+    def __format_edge(self, edge: Any, formatted_nodes: Dict[Any, str]) -> str:
         """
         Format the edge information for graph visualization.
 
         Args:
             edge (Any): The edge in the graph, including source, target, and properties.
-            node_numbers (Dict[Any, int]): A mapping of node names to their corresponding numbers.
+            formatted_nodes (Dict[Any, str]): A mapping of node names to their numbered, formatted representation.
 
         Returns:
             str: The formatted string representation of the edge.
@@ -386,6 +673,6 @@ class Simulation:
 
         prop_string = ""
         if props:
-            prop_string = "|" + "\n".join([f"{k}: {v}" for k, v in props.items()]) + "|"
+            prop_string = "|" + "\n".join(f"{k}: {v}" for k, v in props.items()) + "|"
 
-        return f"{node_numbers[src]}[{self.__format_node(src, self.graph.nodes[src])}] -->{prop_string} {node_numbers[tgt]}[{self.__format_node(tgt, self.graph.nodes[tgt])}]"
+        return f"{formatted_nodes[src]} -->{prop_string} {formatted_nodes[tgt]}"
@@ -19,15 +19,11 @@ on probabilistic patient movement through the system.
 from dataclasses import dataclass, field
 
 import networkx as nx
-import numpy as np
 
 import sfttoolbox
 
-
-# This allows a standard distribution call to take in the patient object (and does nothing with it)
-@sfttoolbox.DES.distribution_wrapper
-def uniform():
-    return np.random.uniform()
+# This takes in the patient object (and does nothing with it), drawing its values in batches
+uniform = sfttoolbox.DES.BufferedUniform()
 
 
 # Create a simple graph
@@ -99,5 +95,5 @@ if __name__ == "__main__":
             G2.edges[edge]["color"] = "blue"
 
     # Use our convenient sankey generator to view the flow
-    sfttoolbox.plotting.generate_sankey(G2)
+    sfttoolbox.plotting.generate_sankey(G2).show()
 # %%
@@ -28,11 +28,8 @@ import numpy as np
 
 import sfttoolbox
 
-
-# This allows a standard distribution call to take in the patient object (and does nothing with it)
-@sfttoolbox.DES.distribution_wrapper
-def uniform():
-    return np.random.uniform()
+# This takes in the patient object (and does nothing with it), drawing its values in batches
+uniform = sfttoolbox.DES.BufferedUniform()
 
 
 @dataclass
@@ -15,7 +15,7 @@ The main tasks covered in this example include:
     - Somerset, UK
     - Dorset, UK
 
-3. Generating 10-minute drive-time isochrone polygons from:
+3. Generating 10-minute drive-time isochrone polygons in parallel from:
     - Musgrove Park Hospital (Taunton)
     - Yeovil Hospital (Yeovil)
 
@@ -32,7 +32,6 @@ Dependencies:
     - geopandas
     - osmnx
     - networkx
-    - alphashape
     - shapely
     - folium
 
@@ -52,82 +51,77 @@ import folium
 
 from sfttoolbox.mapping import IsochroneGenerator
 
-# Initialise the generator
-iso_generator = IsochroneGenerator()
-
-# Load road networks for specific locations
-iso_generator.load_graph(
-    "Yeovil", lat=50.9448, lon=-2.6343, distance=24140
-)  # 15 miles, default distance is 40 miles
-iso_generator.load_graph("Taunton", lat=51.0113, lon=-3.1207, distance=24140)
-
-# Store Somerset's administrative boundary
-iso_generator.generate_boundary("Somerset, UK")
-
-# Store Dorset's administrative boundary
-iso_generator.generate_boundary("Dorset, UK")
-
-# Generate 10-minute drive-time isochrones
-iso_generator.generate_isochrone(
-    place_name="Taunton",
-    isochrone_name="Musgrove Park Hospital",
-    lat=51.0113,
-    lon=-3.1207,
-    drive_time=10,
-)  # 10 minutes
-iso_generator.generate_isochrone(
-    place_name="Yeovil",
-    isochrone_name="Yeovil Hospital",
-    lat=50.9448,
-    lon=-2.6343,
-    drive_time=10,
-)
-
-# Compute shortest paths and full road network within isochrones
-iso_generator.generate_shortest_paths("Musgrove Park Hospital")
-iso_generator.convert_road_network_to_gdf("Yeovil Hospital")
-
-# Save results
-iso_generator.save_all_data("new_isochrone_data.geojson")
-
-# Load GeoJSON data and initialise map
-with open("new_isochrone_data.geojson") as f:
-    geojson_data = json.load(f)
-
-first_feature = geojson_data["features"][0]
-center_lat, center_lon = (
-    first_feature["geometry"]["coordinates"][0][0][1],
-    first_feature["geometry"]["coordinates"][0][0][0],
-)
-m = folium.Map(location=[center_lat, center_lon], zoom_start=9)
-
-# Plot each feature
-for index, feature in enumerate(geojson_data["features"]):
-    props, geometry = feature.get("properties", {}), feature["geometry"]
-    feature_type = props.get("type", "unknown")
-    name = props.get("name")
-    color = "red" if feature_type == "isochrone" else "black"
-
-    fg = folium.FeatureGroup(name=name, show=True)
-
-    folium.GeoJson(
-        feature,
-        style_function=lambda f, col=color: {
-            "fillColor": col,
-            "color": col,
-            "weight": 2,
-            "fillOpacity": 0.1,
-        },
-    ).add_to(fg)
-
-    if feature_type == "isochrone":
-        folium.Marker(
-            [props["lat"], props["lon"]], icon=folium.Icon(icon="hospital", prefix="fa")
+# The guard is required for generate_isochrones to start its worker processes
+if __name__ == "__main__":
+    # Initialise the generator
+    iso_generator = IsochroneGenerator()
+
+    # Load road networks for specific locations
+    iso_generator.load_graph(
+        "Yeovil", lat=50.9448, lon=-2.6343, distance=24140
+    )  # 15 miles, default distance is 40 miles
+    iso_generator.load_graph("Taunton", lat=51.0113, lon=-3.1207, distance=24140)
+
+    # Store Somerset's administrative boundary
+    iso_generator.generate_boundary("Somerset, UK")
+
+    # Store Dorset's administrative boundary
+    iso_generator.generate_boundary("Dorset, UK")
+
+    # Generate 10-minute drive-time isochrones, each in its own worker process
+    iso_generator.generate_isochrones(
+        {
+            "Musgrove Park Hospital": ("Taunton", 51.0113, -3.1207, 10),  # 10 minutes
+            "Yeovil Hospital": ("Yeovil", 50.9448, -2.6343, 10),
+        }
+    )
+
+    # Compute shortest paths and full road network within isochrones
+    iso_generator.generate_shortest_paths("Musgrove Park Hospital")
+    iso_generator.convert_road_network_to_gdf("Yeovil Hospital")
+
+    # Save results
+    iso_generator.save_all_data("new_isochrone_data.geojson")
+
+    # Load GeoJSON data and initialise map
+    with open("new_isochrone_data.geojson") as f:
+        geojson_data = json.load(f)
+
+    first_feature = geojson_data["features"][0]
+    center_lat, center_lon = (
+        first_feature["geometry"]["coordinates"][0][0][1],
+        first_feature["geometry"]["coordinates"][0][0][0],
+    )
+    m = folium.Map(location=[center_lat, center_lon], zoom_start=9)
+
+    # Plot each feature
+    for index, feature in enumerate(geojson_data["features"]):
+        props, geometry = feature.get("properties", {}), feature["geometry"]
+        feature_type = props.get("type", "unknown")
+        name = props.get("name")
+        color = "red" if feature_type == "isochrone" else "black"
+
+        fg = folium.FeatureGroup(name=name, show=True)
+
+        folium.GeoJson(
+            feature,
+            style_function=lambda f, col=color: {
+                "fillColor": col,
+                "color": col,
+                "weight": 2,
+                "fillOpacity": 0.1,
+            },
         ).add_to(fg)
 
-    fg.add_to(m)
+        if feature_type == "isochrone":
+            folium.Marker(
+                [props["lat"], props["lon"]],
+                icon=folium.Icon(icon="hospital", prefix="fa"),
+            ).add_to(fg)
 
-# Add Layer Control and save the map
-folium.LayerControl(collapsed=False).add_to(m)
+        fg.add_to(m)
 
-m.save("isochrone_map.html")
+    # Add Layer Control and save the map
+    folium.LayerControl(collapsed=False).add_to(m)
+
+    m.save("isochrone_map.html")
@@ -2,7 +2,7 @@
 Isochrone Module
 
 This module provides a framework for generating isochrone polygons based on travel times within road networks
-using OpenStreetMap data. It uses the `osmnx`, `networkx`, and `alphashape` libraries to load graphs, build
+using OpenStreetMap data. It uses the `osmnx`, `networkx`, and `shapely` libraries to load graphs, build
 subgraphs based on drive times, and generate geometric representations of reachable areas.
 
 Class:
@@ -14,12 +14,11 @@ Usage:
        ```python
        import json
        import os
-       import alphashape
        import geopandas as gpd
        import networkx as nx
        import osmnx as ox
-       from collections import namedtuple
-       from shapely import wkt
+       from dataclasses import dataclass
+       from shapely import concave_hull, wkt
        ```
     2. Create an instance of `IsochroneGenerator`.
     3. Load a graph using a place name or coordinates with `load_graph`.
@@ -29,7 +28,7 @@ Usage:
         - Convert the graph to GeoDataFrames using `convert_road_network_to_gdf`.
         - Generate shortest paths within the isochrone using `generate_shortest_paths`.
         - Export isochrone and boundary data to GeoJSON using `save_all_data`.
-        - Save network graphs using `save_graph`.
+        - Save network graphs using `save_graph`, or all loaded graphs at once using `save_graphs`.
 
 Example:
     See the file titled `example.py` in the `examples` directory.
@@ -42,33 +41,152 @@ __all__ = ["IsochroneGenerator", "IsochroneRegistry"]
 
 import json
 import os
-from collections import namedtuple
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
 
-import alphashape
 import geopandas as gpd
 import networkx as nx
-import osmnx as ox
-from shapely import wkt
-from shapely.geometry import LineString, Point, Polygon, mapping
+import numpy as np
+from shapely import concave_hull, wkt
+from shapely.geometry import LineString, MultiPoint, Polygon, shape
+
+# osmnx takes over a second to import, so it is imported by the functions that use it
+
+
+@dataclass(slots=True)
+class IsochroneRegistry:
+    """
+    Record of a generated isochrone, as stored in `IsochroneGenerator.registry`.
+
+    Attributes:
+        polygon (Polygon): The isochrone polygon.
+        centre_node (int): Node nearest to the isochrone's centre point.
+        lat (float): Latitude of the centre point.
+        lon (float): Longitude of the centre point.
+        drive_time (float): Time limit (in minutes) from the centre node.
+        place_name (str): Name of the place whose graph the isochrone was generated from.
+        reachable_nodes (list): Nodes reachable from the centre node within the drive time.
+        sub_graph (Optional[nx.MultiDiGraph]): Road network within the isochrone, built from `reachable_nodes` the
+            first time it's needed.
+    """
+
+    polygon: Polygon
+    centre_node: int
+    lat: float
+    lon: float
+    drive_time: float
+    place_name: str
+    reachable_nodes: list
+    sub_graph: Optional[nx.MultiDiGraph] = None
+
+
+# Graphs and node coordinates handed to each worker process once by generate_isochrones
+_worker_graphs = {}
+
+
+def _init_worker(graphs: dict) -> None:
+    """
+    Store the graphs and node coordinates a worker process needs for generating isochrones.
+
+    Args:
+        graphs (dict): Mapping of place name to (graph, node index, node coordinates).
+    """
+    _worker_graphs.update(graphs)
+
+
+def _build_isochrone(
+    G: nx.MultiDiGraph,
+    node_index: dict,
+    node_xy: np.ndarray,
+    lat: float,
+    lon: float,
+    drive_time: float,
+    ratio: float,
+) -> tuple:
+    """
+    Build an isochrone polygon for a given location and drive time.
+
+    Args:
+        G (nx.MultiDiGraph): Time-annotated road network.
+        node_index (dict): Mapping of node to its row in `node_xy`.
+        node_xy (np.ndarray): (N, 2) array of node coordinates.
+        lat (float): Latitude of the center point.
+        lon (float): Longitude of the center point.
+        drive_time (float): Time limit (in minutes) from the center node.
+        ratio (float): Concaveness of the hull, from 0 (most concave) to 1 (the convex hull).
+
+    Returns:
+        tuple: A tuple of (polygon, centre node, reachable nodes).
+    """
+    import osmnx as ox
+
+    centre_node = ox.distance.nearest_nodes(G, lon, lat)
+    # Only the reachable nodes are needed for the hull, so the subgraph isn't copied here
+    reachable_nodes = list(
+        nx.single_source_dijkstra_path_length(
+            G, centre_node, cutoff=drive_time, weight="time"
+        )
+    )
+
+    rows = np.fromiter(
+        (node_index[n] for n in reachable_nodes),
+        dtype=np.intp,
+        count=len(reachable_nodes),
+    )
+    polygon = concave_hull(MultiPoint(node_xy[rows]), ratio=ratio)
+
+    return polygon, centre_node, reachable_nodes
+
+
+def _build_worker_isochrone(
+    place_name: str, lat: float, lon: float, drive_time: float, ratio: float
+) -> tuple:
+    """
+    Build an isochrone in a worker process from the graphs given to `_init_worker`.
 
-IsochroneRegistry = namedtuple(
-    "IsochroneRegistry",
-    ["polygon", "centre_node", "lat", "lon", "drive_time", "place_name", "sub_graph"],
-)
+    Args:
+        place_name (str): Name of the place whose graph, as given to `_init_worker`, is used.
+        lat (float): Latitude of the center point.
+        lon (float): Longitude of the center point.
+        drive_time (float): Time limit (in minutes) from the center node.
+        ratio (float): Concaveness of the hull, from 0 (most concave) to 1 (the convex hull).
+
+    Returns:
+        tuple: A tuple of (polygon, centre node, reachable nodes).
+    """
+    return _build_isochrone(*_worker_graphs[place_name], lat, lon, drive_time, ratio)
 
 
 class IsochroneGenerator:
-    def __init__(self, default_speed: float = 48.28032):
+    def __init__(
+        self, default_speed: float = 48.28032, cache_dir: Optional[str] = None
+    ):
         """
-        Initialise the IsochroneGenerator with a default speed for edges missing speed data.
+        Initialise the IsochroneGenerator with a fallback speed for roads with no known speed.
+
+        Edges without a maxspeed tag get the mean speed of the tagged edges of the same highway type. The default
+        speed is only used for edges whose highway type has no tagged edges at all.
 
         Args:
-            default_speed (float): Default travel speed in km/h. Defaults to 48.28032 km/h = 30 miles/h.
+            default_speed (float): Fallback travel speed in km/h, for edges whose highway type has no known speed.
+                Defaults to 48.28032 km/h = 30 miles/h.
+            cache_dir (Optional[str], optional): Directory to cache downloaded road networks and boundaries in, so
+                repeat runs don't query OpenStreetMap again. Defaults to None, which disables the cache.
         """
         self.default_speed = default_speed
+        self.cache_dir = cache_dir
         self.registry = {}
         self.place_boundary = {}
         self.graphs = {}
+        self.node_index = {}
+        self.node_xy = {}
+        self.indexed_graphs = (
+            {}
+        )  # the graph `node_index` and `node_xy` were built from, for each place
+        # (place, lat, lon, drive time, ratio) -> (polygon, centre node, reachable nodes), so repeats are free
+        self.isochrone_results = {}
         self.circles = {}  # reserved for future use
 
     def load_graph(
@@ -95,60 +213,113 @@ class IsochroneGenerator:
         Raises:
             ValueError: If neither place_name nor lat/lon are provided.
         """
+        import osmnx as ox
+
         if lat is not None and lon is not None:
-            G = ox.graph_from_point(
-                center_point=[lat, lon],
-                dist=distance,
-                dist_type="network",
-                network_type=network_type,
-                simplify=True,
+            cache_path = self.__cache_path(
+                f"{place_name}_{network_type}_{lat}_{lon}_{distance}.graphml"
             )
         else:
-            G = ox.graph_from_place(place_name, network_type=network_type)
+            cache_path = self.__cache_path(f"{place_name}_{network_type}.graphml")
+
+        if cache_path is not None and os.path.exists(cache_path):
+            G = ox.load_graphml(cache_path)
+        else:
+            if lat is not None and lon is not None:
+                G = ox.graph_from_point(
+                    center_point=[lat, lon],
+                    dist=distance,
+                    dist_type="network",
+                    network_type=network_type,
+                    simplify=True,
+                )
+            else:
+                G = ox.graph_from_place(place_name, network_type=network_type)
+
+            # Cached before the times are added, so they always use the current default speed
+            if cache_path is not None:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                ox.save_graphml(G, cache_path)
 
         self.__update_graph_with_times(G)
         self.graphs[place_name] = G
+        self.__index_node_coords(place_name)
         return G
 
-    def __update_graph_with_times(self, G: nx.MultiDiGraph) -> None:
+    def __cache_path(self, filename: str) -> Optional[str]:
         """
-        Annotate graph edges with estimated travel times based on edge length and speed.
+        Get the path of a file in the cache directory.
+
+        Args:
+            filename (str): Name of the cached file.
+
+        Returns:
+            Optional[str]: Path of the cached file, or None if caching is disabled.
         """
-        for u, v, k, data in G.edges(data=True, keys=True):
-            if max_speed := data.get("maxspeed"):
-                if isinstance(max_speed, list):
-                    speed = sum(
-                        self.__parse_max_speed_to_kmh(s) for s in max_speed
-                    ) / len(max_speed)
-                else:
-                    speed = self.__parse_max_speed_to_kmh(max_speed)
-            else:
-                speed = self.default_speed
+        if self.cache_dir is None:
+            return None
 
-            speed *= 0.9  # Account for real-world delays like traffic.
-            meters_per_minute = speed * 1000 / 60
-            data["time"] = float(data["length"]) / meters_per_minute
+        return os.path.join(self.cache_dir, filename)
 
-    def __parse_max_speed_to_kmh(self, max_speed: str) -> float:
+    def __check_node_coords(self, place_name: str) -> None:
         """
-        Convert a maxspeed string to a float value in km/h.
+        Index the node coordinates of a place's graph if they haven't been, or the graph has been replaced since.
+
+        Isochrone results cached for the place are dropped along with the old index, as they belong to the old graph.
 
         Args:
-            max_speed (str): String representation of speed, e.g., '30 mph', '50 km/h'.
+            place_name (str): Name of the place associated with the graph.
+        """
+        if self.indexed_graphs.get(place_name) is not self.graphs[place_name]:
+            self.__index_node_coords(place_name)
 
-        Returns:
-            float: Parsed speed in km/h.
+    def __index_node_coords(self, place_name: str) -> None:
+        """
+        Store the node coordinates of a graph as a contiguous (N, 2) array of (x, y), with a mapping of node to row.
+
+        Args:
+            place_name (str): Name of the place associated with the graph.
+        """
+        G = self.graphs[place_name]
+        nodes = list(G.nodes)
+
+        self.indexed_graphs[place_name] = G
+        # Isochrones generated from a previous graph for this place may no longer match it
+        self.isochrone_results = {
+            key: result
+            for key, result in self.isochrone_results.items()
+            if key[0] != place_name
+        }
+
+        self.node_index[place_name] = {node: i for i, node in enumerate(nodes)}
+        self.node_xy[place_name] = np.fromiter(
+            (
+                coord
+                for node in nodes
+                for coord in (G.nodes[node]["x"], G.nodes[node]["y"])
+            ),
+            dtype=np.float64,
+            count=2 * len(nodes),
+        ).reshape(-1, 2)
+
+    def __update_graph_with_times(self, G: nx.MultiDiGraph) -> None:
+        """
+        Annotate graph edges with estimated travel times in minutes based on edge length and speed.
+
+        Edge speeds come from OSMnx, which parses the maxspeed tags and imputes missing speeds from the mean speed of
+        the same highway type, falling back to the default speed.
         """
-        if max_speed.lower() == "none" or not max_speed.strip():
-            return self.default_speed
+        import osmnx as ox
+
+        ox.add_edge_speeds(G, fallback=self.default_speed)
 
-        conversion = 1.60934 if "mph" in max_speed else 1
-        try:
-            speed = int(max_speed.split()[0]) * conversion
-        except (ValueError, IndexError):
-            speed = self.default_speed
+        edges = ox.graph_to_gdfs(G, nodes=False, fill_edge_geometry=False)
 
-        return speed
+        # Account for real-world delays like traffic.
+        meters_per_minute = edges["speed_kph"].to_numpy(dtype=float) * 0.9 * 1000 / 60
+        times = edges["length"].to_numpy(dtype=float) / meters_per_minute
+
+        nx.set_edge_attributes(G, dict(zip(edges.index, times.tolist())), "time")
 
     def generate_boundary(self, place_name: str) -> gpd.GeoDataFrame:
         """
@@ -160,7 +331,21 @@ class IsochroneGenerator:
         Returns:
             gpd.GeoDataFrame: Geometry of the place boundary.
         """
-        place_boundary = ox.geocode_to_gdf(place_name)["geometry"].iloc[0]
+        import osmnx as ox
+
+        cache_path = self.__cache_path(f"{place_name}_boundary.geojson")
+
+        if cache_path is not None and os.path.exists(cache_path):
+            with open(cache_path) as f:
+                place_boundary = shape(json.load(f))
+        else:
+            place_boundary = ox.geocode_to_gdf(place_name)["geometry"].iloc[0]
+            if cache_path is not None:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                # Written with json rather than GDAL so the coordinates are stored at full precision
+                with open(cache_path, "w") as f:
+                    json.dump(place_boundary.__geo_interface__, f)
+
         self.place_boundary[place_name] = place_boundary
         return place_boundary
 
@@ -171,7 +356,7 @@ class IsochroneGenerator:
         lat: float,
         lon: float,
         drive_time: float,
-        alpha: float = 30,
+        ratio: float = 0.1,
     ) -> Polygon:
         """
         Generate an isochrone polygon for a given location and drive time.
@@ -182,57 +367,229 @@ class IsochroneGenerator:
             lat (float): Latitude of the center point.
             lon (float): Longitude of the center point.
             drive_time (float): Time limit (in minutes) from the center node.
-            alpha (float): Alpha parameter for alpha shape generation.
+            ratio (float): Concaveness of the hull, from 0 (most concave) to 1 (the convex hull).
 
         Returns:
             Polygon: A shapely Polygon representing the isochrone boundary.
         """
-        G = self.graphs[place_name]
-        centre_node = ox.distance.nearest_nodes(G, lon, lat)
-        sub_graph = nx.ego_graph(G, centre_node, radius=drive_time, distance="time")
-        points = [(data["x"], data["y"]) for _, data in sub_graph.nodes(data=True)]
-        polygon = alphashape.alphashape(points, alpha=alpha)
+        self.__check_node_coords(place_name)
+        key = self.__isochrone_key(place_name, lat, lon, drive_time, ratio)
+
+        if key not in self.isochrone_results:
+            self.isochrone_results[key] = _build_isochrone(
+                self.graphs[place_name],
+                self.node_index[place_name],
+                self.node_xy[place_name],
+                lat,
+                lon,
+                drive_time,
+                ratio,
+            )
+
+        return self.__register_isochrone(
+            isochrone_name, place_name, lat, lon, drive_time, key
+        )
+
+    @staticmethod
+    def __isochrone_key(
+        place_name: str, lat: float, lon: float, drive_time: float, ratio: float
+    ) -> tuple:
+        """
+        Get the key isochrone results are cached under, with coordinates rounded to about a metre.
+
+        Args:
+            place_name (str): Name of the place associated with the graph.
+            lat (float): Latitude of the center point.
+            lon (float): Longitude of the center point.
+            drive_time (float): Time limit (in minutes) from the center node.
+            ratio (float): Concaveness of the hull, from 0 (most concave) to 1 (the convex hull).
+
+        Returns:
+            tuple: A tuple of (place_name, lat, lon, drive_time, ratio).
+        """
+        return place_name, round(lat, 5), round(lon, 5), drive_time, ratio
+
+    def __register_isochrone(
+        self,
+        isochrone_name: str,
+        place_name: str,
+        lat: float,
+        lon: float,
+        drive_time: float,
+        key: tuple,
+    ) -> Polygon:
+        """
+        Add a cached isochrone result to the registry.
 
-        if polygon and polygon.geom_type == "MultiPolygon":
-            polygon = alphashape.alphashape(points, alpha=alpha / 2)
+        Args:
+            isochrone_name (str): Identifier for the isochrone.
+            place_name (str): Name of the place associated with the graph.
+            lat (float): Latitude of the center point.
+            lon (float): Longitude of the center point.
+            drive_time (float): Time limit (in minutes) from the center node.
+            key (tuple): Key of the result in `isochrone_results`, from `__isochrone_key`.
 
+        Returns:
+            Polygon: The isochrone polygon.
+        """
+        polygon, centre_node, reachable_nodes = self.isochrone_results[key]
         self.registry[isochrone_name] = IsochroneRegistry(
-            polygon, centre_node, lat, lon, drive_time, place_name, sub_graph
+            polygon=polygon,
+            centre_node=centre_node,
+            lat=lat,
+            lon=lon,
+            drive_time=drive_time,
+            place_name=place_name,
+            reachable_nodes=reachable_nodes,
         )
         return polygon
 
-    def generate_shortest_paths(self, isochrone_name: str) -> list[dict]:
+    def generate_isochrones(
+        self,
+        isochrones: dict[str, tuple[str, float, float, float]],
+        ratio: float = 0.1,
+        max_workers: Optional[int] = None,
+    ) -> dict[str, Polygon]:
+        """
+        Generate several isochrone polygons in parallel, each in its own worker process.
+
+        Each worker is sent the graphs it needs once, so this pays off when there are several isochrones to
+        generate. Isochrones that have already been generated aren't sent to the workers. Callers should guard
+        their script with `if __name__ == "__main__":` so the workers can start.
+
+        Args:
+            isochrones (dict): Mapping of isochrone name to (place_name, lat, lon, drive_time).
+            ratio (float): Concaveness of the hulls, from 0 (most concave) to 1 (the convex hull).
+            max_workers (Optional[int], optional): Maximum number of worker processes. Defaults to the number of CPUs.
+
+        Returns:
+            dict[str, Polygon]: A shapely Polygon for each isochrone name.
+        """
+        for place_name, *_ in isochrones.values():
+            self.__check_node_coords(place_name)
+
+        keys = {
+            isochrone_name: self.__isochrone_key(*isochrone, ratio)
+            for isochrone_name, isochrone in isochrones.items()
+        }
+        # One job per distinct location, skipping any already generated
+        pending = {
+            key: isochrones[isochrone_name]
+            for isochrone_name, key in keys.items()
+            if key not in self.isochrone_results
+        }
+
+        if len(pending) <= 1 or max_workers == 1:
+            return {
+                isochrone_name: self.generate_isochrone(
+                    place_name, isochrone_name, *location, ratio=ratio
+                )
+                for isochrone_name, (place_name, *location) in isochrones.items()
+            }
+
+        graphs = {}
+        for place_name, *_ in pending.values():
+            graphs[place_name] = (
+                self.graphs[place_name],
+                self.node_index[place_name],
+                self.node_xy[place_name],
+            )
+
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers or os.cpu_count(), len(pending)),
+            initializer=_init_worker,
+            initargs=(graphs,),
+        ) as executor:
+            futures = {
+                key: executor.submit(_build_worker_isochrone, *isochrone, ratio)
+                for key, isochrone in pending.items()
+            }
+            for key, future in futures.items():
+                self.isochrone_results[key] = future.result()
+
+        return {
+            isochrone_name: self.__register_isochrone(
+                isochrone_name, *isochrones[isochrone_name], keys[isochrone_name]
+            )
+            for isochrone_name in isochrones
+        }
+
+    def __get_sub_graph(self, isochrone_name: str) -> nx.MultiDiGraph:
+        """
+        Get the road network within an isochrone, building it from the reachable nodes on first use.
+
+        Args:
+            isochrone_name (str): Name of the isochrone in the registry.
+
+        Returns:
+            nx.MultiDiGraph: The subgraph of nodes reachable within the isochrone's drive time.
+        """
+        isochrone_data = self.registry[isochrone_name]
+
+        if isochrone_data.sub_graph is None:
+            G = self.graphs[isochrone_data.place_name]
+            isochrone_data.sub_graph = G.subgraph(isochrone_data.reachable_nodes).copy()
+
+        return isochrone_data.sub_graph
+
+    def generate_shortest_paths(
+        self, isochrone_name: str, tolerance: float = 0.0005
+    ) -> list[dict]:
         """
         Generate shortest path LineStrings from the isochrone center to its polygon boundary.
 
         Args:
             isochrone_name (str): Name of the isochrone in the registry.
+            tolerance (float): Tolerance in degrees used to simplify the polygon boundary before
+                routing to it, so near-colinear vertices do not each get a path. Use 0 to route
+                to every boundary vertex. Defaults to 0.0005.
 
         Returns:
             list[dict]: A list of GeoJSON-like LineString features representing shortest paths.
         """
+        import osmnx as ox
+
+        sub_graph = self.__get_sub_graph(isochrone_name)
         isochrone_data = self.registry[isochrone_name]
-        sub_graph = isochrone_data.sub_graph
+        self.__check_node_coords(isochrone_data.place_name)
+        node_index = self.node_index[isochrone_data.place_name]
+        node_xy = self.node_xy[isochrone_data.place_name]
 
         geojson_paths = []
-        boundary_coords = (
-            list(isochrone_data.polygon.exterior.coords)
-            if isochrone_data.polygon.geom_type == "Polygon"
+        boundary_coords = []
+        if isochrone_data.polygon.geom_type == "Polygon":
+            boundary = isochrone_data.polygon
+            if tolerance > 0:
+                boundary = boundary.simplify(tolerance, preserve_topology=True)
+            boundary_coords = list(boundary.exterior.coords)
+
+        # A single query for every boundary point, so the spatial index is only built once
+        nearest_nodes = (
+            ox.distance.nearest_nodes(
+                sub_graph,
+                [lon for lon, _ in boundary_coords],
+                [lat for _, lat in boundary_coords],
+            )
+            if boundary_coords
             else []
         )
-        boundary_points = [Point(lon, lat) for lon, lat in boundary_coords]
 
-        for point in boundary_points:
-            nearest_node = ox.distance.nearest_nodes(sub_graph, point.x, point.y)
-            route = nx.shortest_path(
-                sub_graph,
-                source=isochrone_data.centre_node,
-                target=nearest_node,
-                weight="length",
-            )
-            path_coords = [
-                (sub_graph.nodes[n]["x"], sub_graph.nodes[n]["y"]) for n in route
-            ]
+        # One Dijkstra run from the centre finds the shortest path to every boundary node. Only predecessors are
+        # kept, as copying a full path for every node in the subgraph is quadratic in the path length.
+        predecessors, _ = nx.dijkstra_predecessor_and_distance(
+            sub_graph, isochrone_data.centre_node, weight="length"
+        )
+
+        for nearest_node in nearest_nodes:
+            if nearest_node not in predecessors:
+                continue
+
+            # Stop at the centre, as zero-length edges back into it also give it predecessors
+            route = [nearest_node]
+            while route[-1] != isochrone_data.centre_node:
+                route.append(predecessors[route[-1]][0])
+
+            path_coords = node_xy[[node_index[n] for n in reversed(route)]]
             geojson_paths.append(
                 {
                     "type": "Feature",
@@ -254,62 +611,69 @@ class IsochroneGenerator:
         Returns:
             tuple: A tuple of (nodes GeoDataFrame, edges GeoDataFrame).
         """
-        sub_graph = self.registry[isochrone_name].sub_graph
+        import osmnx as ox
+
+        sub_graph = self.__get_sub_graph(isochrone_name)
         return ox.graph_to_gdfs(sub_graph, nodes=True, edges=True)
 
     def save_all_data(self, filename: str) -> None:
         """
         Save all boundary, isochrone, and circle data to a GeoJSON file.
 
+        Features are written one at a time, so the whole collection is never held in memory.
+
         Args:
             filename (str): Path to the output GeoJSON file.
         """
-        features = []
+        with open(filename, "w") as f:
+            f.write('{"type": "FeatureCollection", "features": [')
+            for i, feature in enumerate(self.__iter_features()):
+                f.write(",\n" if i else "\n")
+                f.write(json.dumps(feature))
+            f.write("\n]}\n")
+
+    def __iter_features(self) -> Iterator[dict]:
+        """
+        Yield a GeoJSON feature for every boundary, isochrone, and circle.
 
+        Yields:
+            dict: A GeoJSON-like feature.
+        """
         for name, geom in self.place_boundary.items():
-            features.append(
-                {
-                    "type": "Feature",
-                    "geometry": mapping(geom),
-                    "properties": {"type": "boundary", "name": name},
-                }
-            )
+            yield {
+                "type": "Feature",
+                "geometry": geom.__geo_interface__,
+                "properties": {"type": "boundary", "name": name},
+            }
 
         for name, result in self.registry.items():
-            features.append(
-                {
-                    "type": "Feature",
-                    "geometry": mapping(result.polygon),
-                    "properties": {
-                        "type": "isochrone",
-                        "name": name,
-                        "centre_node": result.centre_node,
-                        "lat": result.lat,
-                        "lon": result.lon,
-                        "time": result.drive_time,
-                        "place_name": result.place_name,
-                    },
-                }
-            )
+            yield {
+                "type": "Feature",
+                "geometry": result.polygon.__geo_interface__,
+                "properties": {
+                    "type": "isochrone",
+                    "name": name,
+                    "centre_node": result.centre_node,
+                    "lat": result.lat,
+                    "lon": result.lon,
+                    "time": result.drive_time,
+                    "place_name": result.place_name,
+                },
+            }
 
         for name, circle in self.circles.items():
-            features.append(
-                {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [circle[0], circle[1]],
-                    },
-                    "properties": {
-                        "type": "circle",
-                        "name": name,
-                        "radius_m": circle[2],
-                    },
-                }
-            )
-
-        with open(filename, "w") as f:
-            json.dump({"type": "FeatureCollection", "features": features}, f, indent=2)
+            yield {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": [circle[0], circle[1]],
+                },
+                "properties": {
+                    "type": "circle",
+                    "name": name,
+                    "radius_m": circle[2],
+                },
+            }
 
     def save_graph(self, graph: nx.MultiDiGraph, filename: str) -> None:
         """
@@ -319,4 +683,35 @@ class IsochroneGenerator:
             graph (nx.MultiDiGraph): The road network graph to be saved.
             filename (str): Destination file path.
         """
+        import osmnx as ox
+
         ox.save_graphml(graph, filename)
+
+    def save_graphs(
+        self, directory: str = ".", max_workers: Optional[int] = None
+    ) -> list[str]:
+        """
+        Save every loaded graph to a GraphML file named after its place, writing the files concurrently.
+
+        Args:
+            directory (str): Directory to write the files to. Defaults to the current directory.
+            max_workers (Optional[int], optional): Maximum number of writer threads. Defaults to one per graph, up
+                to 8.
+
+        Returns:
+            list[str]: Paths of the saved files, in the same order as `graphs`.
+        """
+        filenames = [
+            os.path.join(directory, f"{place_name}.graphml")
+            for place_name in self.graphs
+        ]
+        if not filenames:
+            return filenames
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers or min(8, len(filenames))
+        ) as executor:
+            # list() so any error raised while writing is re-raised here
+            list(executor.map(self.save_graph, self.graphs.values(), filenames))
+
+        return filenames
@@ -1,13 +1,18 @@
 __all__ = ["generate_sankey"]
 
+from typing import TYPE_CHECKING
+
 import networkx as nx
-import plotly.graph_objects as go
-from pyvis.network import Network
+
+# plotly and pyvis are imported by the functions that use them, so importing sfttoolbox stays fast
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+    from pyvis.network import Network
 
 
-def generate_sankey(G: nx.Graph) -> None:
+def generate_sankey(G: nx.Graph, show: bool = False) -> "go.Figure":
     """
-    Generate and display a Sankey diagram from a NetworkX graph.
+    Generate a Sankey diagram from a NetworkX graph.
 
     This function takes a NetworkX graph `G` and creates an interactive Sankey diagram using Plotly.
     The graph `G` should have nodes and edges with specific attributes as follows:
@@ -21,9 +26,11 @@ def generate_sankey(G: nx.Graph) -> None:
 
     Parameters:
     G (nx.Graph): A NetworkX graph with nodes and edges containing the necessary attributes.
+    show (bool, optional): Whether to also display the figure. Defaults to False.
 
     Returns:
-    None
+    go.Figure: The Plotly figure, for the caller to `.show()` or save, e.g. with
+    `fig.write_html("sankey.html", include_plotlyjs="cdn")` which avoids embedding plotly.js in every file.
 
     Example:
     --------
@@ -42,17 +49,30 @@ def generate_sankey(G: nx.Graph) -> None:
     G.add_edge("A", "B", value=10, color="yellow")
     G.add_edge("B", "C", value=5, color="purple")
 
-    generate_sankey(G)
+    fig = generate_sankey(G)
+    fig.show()
     ```
 
     This example creates a simple directed graph with three nodes and two edges, and then generates a Sankey diagram.
     """
-    sources, targets = [*zip(*G.edges)]
-    nodes = list(G.nodes)
+    import plotly.graph_objects as go
 
-    get_node_indices = lambda node_list: [
-        idx for node in node_list for idx, val in enumerate(nodes) if val == node
-    ]
+    node_indices = {node: idx for idx, node in enumerate(G.nodes)}
+
+    labels, node_colors = [], []
+    for node, data in G.nodes(data=True):
+        labels.append(f"{node}")
+        if "color" in data:
+            node_colors.append(data["color"])
+
+    sources, targets, values, edge_colors = [], [], [], []
+    for source, target, data in G.edges(data=True):
+        sources.append(node_indices[source])
+        targets.append(node_indices[target])
+        if "value" in data:
+            values.append(data["value"])
+        if "color" in data:
+            edge_colors.append(data["color"])
 
     fig = go.Figure(
         data=[
@@ -61,26 +81,29 @@ def generate_sankey(G: nx.Graph) -> None:
                     pad=15,
                     thickness=10,
                     line=dict(color="black", width=0.5),
-                    label=[f"{node}" for node in G.nodes],
+                    label=labels,
                     align="left",
-                    color=list(nx.get_node_attributes(G, "color").values()),
+                    color=node_colors,
                 ),
                 link=dict(
-                    source=get_node_indices(sources),
-                    target=get_node_indices(targets),
-                    value=list(nx.get_edge_attributes(G, "value").values()),
-                    color=list(nx.get_edge_attributes(G, "color").values()),
+                    source=sources,
+                    target=targets,
+                    value=values,
+                    color=edge_colors,
                 ),
             )
         ]
     )
 
-    fig.show()
+    if show:
+        fig.show()
+
+    return fig
 
 
 def visualise_network(
     G: nx.Graph, filename: str = None, show_physics: bool = False, **kwargs
-) -> Network:
+) -> "Network":
     """
     Visualize a NetworkX graph using pyvis.
 
@@ -112,6 +135,8 @@ def visualise_network(
     visualise_network(G, filename="test.html", show_physics=True)
     ```
     """
+    from pyvis.network import Network
+
     nt = Network(**kwargs)
 
     nt.from_nx(G)
@@ -3,6 +3,7 @@ from typing import Any, List
 from unittest.mock import Mock
 
 import networkx as nx
+import numpy as np
 import pytest
 
 import sfttoolbox
@@ -139,6 +140,124 @@ def test_traverse_graph(simulation: sfttoolbox.DES.Simulation) -> None:
     assert patient.pathway == ["Start"]
 
 
+def test_traverse_graph_branching(patient_generator: MockPatientGenerator) -> None:
+    """
+    Test to ensure a patient follows the edge selected by the node's distribution.
+
+    Args:
+        patient_generator (MockPatientGenerator): The mock patient generator.
+    """
+    G = nx.DiGraph()
+    G.add_node("Start", distribution=Mock(return_value=0.7))
+    G.add_edge("Start", "Left", probability=0.5)
+    G.add_edge("Start", "Right", probability=0.5)
+    simulation = sfttoolbox.DES.Simulation(G, patient_generator, 7)
+
+    patient = MockPatient(patient_id=1)
+    result = simulation.traverse_graph("Start", patient)
+    assert result is patient
+    assert patient.pathway == ["Start", "Right"]
+
+
+def test_traverse_graph_chain(patient_generator: MockPatientGenerator) -> None:
+    """
+    Test to ensure a patient passes through a run of single-successor nodes to the end of the pathway.
+
+    Args:
+        patient_generator (MockPatientGenerator): The mock patient generator.
+    """
+    G = nx.DiGraph()
+    G.add_edges_from([("Start", "First"), ("First", "Second"), ("Second", "End")])
+    simulation = sfttoolbox.DES.Simulation(G, patient_generator, 7)
+
+    patient = MockPatient(patient_id=1)
+    result = simulation.traverse_graph("Start", patient)
+    assert result is patient
+    assert patient.pathway == ["Start", "First", "Second", "End"]
+
+
+def test_traverse_graph_probabilities_just_below_one() -> None:
+    """
+    Test to ensure a draw above edge probabilities that sum to just below 1 still selects the last edge.
+    """
+    G = nx.DiGraph()
+    G.add_node("Start", distribution=Mock(return_value=0.99999999995))
+    G.add_edge("Start", "A", probability=0.5)
+    G.add_edge("Start", "B", probability=0.4999999999)
+    simulation = sfttoolbox.DES.Simulation(G, MockPatientGenerator(), number_of_days=1)
+
+    patient = MockPatient(patient_id=1)
+    simulation.traverse_graph("Start", patient, check_capacity=False)
+    assert patient.pathway == ["Start", "B"]
+
+    batch = [MockPatient(patient_id=i) for i in range(2, 4)]
+    simulation._traverse_graph_batch("Start", batch)
+    assert [patient.pathway for patient in batch] == [["Start", "B"], ["Start", "B"]]
+
+
+def test_traverse_graph_batch(patient_generator: MockPatientGenerator) -> None:
+    """
+    Test to ensure a batch of patients is split across edges by the node's distribution.
+
+    Args:
+        patient_generator (MockPatientGenerator): The mock patient generator.
+    """
+    G = nx.DiGraph()
+    G.add_node("Start", distribution=Mock(side_effect=[0.2, 0.9, 0.4]))
+    G.add_edge("Start", "Left", probability=0.5)
+    G.add_edge("Start", "Right", probability=0.5)
+    simulation = sfttoolbox.DES.Simulation(G, patient_generator, 7)
+
+    patients = [MockPatient(patient_id=i) for i in range(3)]
+    results = simulation._traverse_graph_batch("Start", patients)
+    assert results == patients
+    assert [patient.pathway[-1] for patient in patients] == ["Left", "Right", "Left"]
+
+
+def test_refresh_routing(simulation: sfttoolbox.DES.Simulation) -> None:
+    """
+    Test to ensure changes to the graph are picked up after refreshing the routing tables.
+
+    Args:
+        simulation (Simulation): The Simulation object.
+    """
+    simulation.graph.add_edge("End", "Discharged")
+    simulation.refresh_routing()
+
+    patient = MockPatient(patient_id=1)
+    simulation.traverse_graph("End", patient, check_capacity=False)
+    assert patient.pathway == ["End", "Discharged"]
+
+
+def test_refresh_routing_collects_new_capacities(
+    simulation: sfttoolbox.DES.Simulation,
+) -> None:
+    """
+    Test to ensure a capacity added to the graph is updated each day after refreshing the routing tables.
+
+    Args:
+        simulation (Simulation): The Simulation object.
+    """
+    capacity = MockCapacity()
+    capacity.update_day = Mock(return_value=[])
+    simulation.graph.nodes["End"]["capacity"] = capacity
+    simulation.refresh_routing()
+
+    assert simulation.capacities["End"] is capacity
+    simulation.run_simulation()
+    assert capacity.update_day.call_count == simulation.final_day_num
+
+
+def test_buffered_uniform() -> None:
+    """
+    Test to ensure the buffered uniform distribution refills its buffer and follows the seeded generator.
+    """
+    distribution = sfttoolbox.DES.BufferedUniform(buffer_size=4, seed=42)
+    values = [distribution(MockPatient(patient_id=i)) for i in range(10)]
+
+    assert values == np.random.default_rng(42).random(10).tolist()
+
+
 def test_plot_graph(simulation: sfttoolbox.DES.Simulation, tmp_path: Path) -> None:
     """
     Test to ensure the graph visualization is created and saved.
@@ -150,3 +269,20 @@ def test_plot_graph(simulation: sfttoolbox.DES.Simulation, tmp_path: Path) -> No
     filename = tmp_path / "graph.html"
     simulation.plot_graph(filename)
     assert filename.exists()
+
+
+def test_plot_graph_after_graph_change(
+    simulation: sfttoolbox.DES.Simulation, tmp_path: Path
+) -> None:
+    """
+    Test to ensure nodes added to the graph after initialisation are included in the visualization.
+
+    Args:
+        simulation (Simulation): The Simulation object.
+        tmp_path (Path): The temporary path for saving the graph visualization.
+    """
+    simulation.graph.add_edge("End", "Discharged")
+
+    filename = tmp_path / "graph.html"
+    simulation.plot_graph(filename)
+    assert "Discharged" in filename.read_text()
@@ -1,11 +1,13 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 import geopandas as gpd
 import networkx as nx
+import osmnx as ox
 import pytest
 from shapely.geometry import Polygon
 
-from sfttoolbox.mapping import IsochroneGenerator
+from sfttoolbox.mapping import IsochroneGenerator, isochrone_generator
 
 
 @pytest.fixture(scope="module")
@@ -46,6 +48,44 @@ def test_isochrone_generated(iso_gen):
     assert isinstance(isochrone.polygon, Polygon)
 
 
+def test_isochrones_generated_in_parallel(iso_gen, monkeypatch):
+    """Test several isochrones generated in worker processes are registered as Polygons."""
+    executors = []
+
+    class SpyExecutor(ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            executors.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(isochrone_generator, "ProcessPoolExecutor", SpyExecutor)
+
+    # Drive times not generated elsewhere, so neither result is already cached
+    polygons = iso_gen.generate_isochrones(
+        {
+            "ParallelIsochrone1": ("Yeovil", 50.9448, -2.6343, 3),
+            "ParallelIsochrone2": ("Yeovil", 50.9448, -2.6343, 4),
+        }
+    )
+    assert len(executors) == 1
+    assert set(polygons) == {"ParallelIsochrone1", "ParallelIsochrone2"}
+    for name, polygon in polygons.items():
+        assert isinstance(polygon, Polygon)
+        assert iso_gen.registry[name].polygon is polygon
+
+
+def test_repeated_isochrone_reused(iso_gen):
+    """Test generating an isochrone at the same location again reuses the first result."""
+    polygon = iso_gen.generate_isochrone(
+        place_name="Yeovil",
+        isochrone_name="RepeatedIsochrone",
+        lat=50.9448,
+        lon=-2.6343,
+        drive_time=5,
+    )
+    assert polygon is iso_gen.registry["TestIsochrone"].polygon
+    assert iso_gen.registry["RepeatedIsochrone"].polygon is polygon
+
+
 def test_convert_to_gdf(iso_gen):
     """Ensure the subgraph can be converted into non-empty GeoDataFrames."""
     nodes_gdf, edges_gdf = iso_gen.convert_road_network_to_gdf("TestIsochrone")
@@ -62,6 +102,82 @@ def test_shortest_paths(iso_gen):
     assert len(paths) >= 0  # Can be empty but must be a list
 
 
+def test_shortest_paths_simplified_boundary(iso_gen):
+    """Ensure the default tolerance simplifies the boundary, so fewer points are routed to than on the full boundary."""
+    all_paths = iso_gen.generate_shortest_paths("TestIsochrone", tolerance=0)
+    simplified_paths = iso_gen.generate_shortest_paths("TestIsochrone")
+    assert 0 < len(simplified_paths) < len(all_paths)
+
+
+@pytest.fixture
+def grid_graph():
+    """A small time-annotated grid road network, so tests can run without downloading one."""
+    G = nx.MultiDiGraph(crs="epsg:4326")
+    size = 5
+    for i in range(size):
+        for j in range(size):
+            G.add_node(i * size + j, x=-2.63 + 0.001 * j, y=50.94 + 0.001 * i)
+    for i in range(size):
+        for j in range(size):
+            for di, dj in ((0, 1), (1, 0)):
+                if i + di < size and j + dj < size:
+                    u, v = i * size + j, (i + di) * size + j + dj
+                    G.add_edge(u, v, length=100.0, time=0.1)
+                    G.add_edge(v, u, length=100.0, time=0.1)
+    return G
+
+
+def test_shortest_paths_zero_length_loop_on_centre(grid_graph):
+    """Ensure shortest paths finish when a zero-length edge leads back into the centre node."""
+    iso = IsochroneGenerator()
+    iso.graphs["Grid"] = grid_graph
+    iso.generate_isochrone("Grid", "Grid", lat=50.942, lon=-2.628, drive_time=1)
+    centre_node = iso.registry["Grid"].centre_node
+    grid_graph.add_edge(centre_node, centre_node, length=0.0, time=0.0)
+    iso.registry["Grid"].sub_graph = None
+
+    paths = iso.generate_shortest_paths("Grid", tolerance=0)
+    assert paths
+    for path in paths:
+        assert len(path["geometry"]["coordinates"]) <= len(grid_graph)
+
+
+def test_isochrone_after_graph_replaced(grid_graph):
+    """Ensure replacing a place's graph re-indexes its node coordinates."""
+    iso = IsochroneGenerator()
+    iso.graphs["Grid"] = nx.MultiDiGraph(grid_graph)
+    iso.generate_isochrone("Grid", "Before", lat=50.942, lon=-2.628, drive_time=1)
+
+    # Same node ids, moved a kilometre north, so stale coordinates would go unnoticed
+    moved = nx.MultiDiGraph(grid_graph)
+    for _, data in moved.nodes(data=True):
+        data["y"] += 0.01
+    iso.graphs["Grid"] = moved
+    polygon = iso.generate_isochrone(
+        "Grid", "After", lat=50.952, lon=-2.628, drive_time=1
+    )
+
+    assert polygon.bounds[1] > 50.945
+
+
+def test_repeated_isochrone_after_graph_replaced(grid_graph):
+    """Ensure isochrones cached for a place aren't reused once its graph is replaced."""
+    iso = IsochroneGenerator()
+    iso.graphs["Grid"] = nx.MultiDiGraph(grid_graph)
+    before = iso.generate_isochrone(
+        "Grid", "Before", lat=50.942, lon=-2.628, drive_time=1
+    )
+
+    replacement = nx.relabel_nodes(grid_graph, lambda node: node + 100)
+    iso.graphs["Grid"] = replacement
+    after = iso.generate_isochrone(
+        "Grid", "After", lat=50.942, lon=-2.628, drive_time=1
+    )
+
+    assert after is not before
+    assert iso.registry["After"].centre_node in replacement
+
+
 def test_save_and_load_geojson(iso_gen):
     """Ensure GeoJSON data is saved correctly and file is created."""
     filename = "test_isochrone_data.geojson"
@@ -77,3 +193,38 @@ def test_save_graph(iso_gen):
     iso_gen.save_graph(G, filename)
     assert os.path.exists(filename)
     os.remove(filename)
+
+
+def test_save_graphs(iso_gen, tmp_path):
+    """Check a GraphML file is saved for every loaded graph."""
+    filenames = iso_gen.save_graphs(tmp_path)
+    assert filenames == [os.path.join(tmp_path, "Yeovil.graphml")]
+    assert os.path.exists(filenames[0])
+
+
+def test_load_graph_from_cache(tmp_path, monkeypatch):
+    """Check a cached road network is reused instead of being downloaded again."""
+    first = IsochroneGenerator(cache_dir=tmp_path)
+    G = first.load_graph("Yeovil", lat=50.9448, lon=-2.6343, distance=1000)
+    assert len(os.listdir(tmp_path)) == 1
+
+    def fail_download(*args, **kwargs):
+        raise AssertionError("The road network should be loaded from the cache")
+
+    monkeypatch.setattr(ox, "graph_from_point", fail_download)
+    second = IsochroneGenerator(cache_dir=tmp_path)
+    cached = second.load_graph("Yeovil", lat=50.9448, lon=-2.6343, distance=1000)
+    assert set(cached.nodes) == set(G.nodes)
+    assert cached.number_of_edges() == G.number_of_edges()
+
+
+def test_boundary_from_cache(tmp_path, monkeypatch):
+    """Check a cached boundary is reused instead of being geocoded again."""
+    boundary = IsochroneGenerator(cache_dir=tmp_path).generate_boundary("Yeovil")
+
+    def fail_geocode(*args, **kwargs):
+        raise AssertionError("The boundary should be loaded from the cache")
+
+    monkeypatch.setattr(ox, "geocode_to_gdf", fail_geocode)
+    cached = IsochroneGenerator(cache_dir=tmp_path).generate_boundary("Yeovil")
+    assert cached.equals(boundary)